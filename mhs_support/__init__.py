@@ -0,0 +1,24 @@
+"""
+L2 platform support case analysis.
+
+Importing the package does no work and loads no heavy dependencies; the report
+runs through `python -m mhs_support` (or support.py). The helpers below are
+loaded on first access, e.g. `from mhs_support import business_timedelta`.
+"""
+
+_LAZY = {
+    'business_timedelta': 'core',
+    'normalize_title': 'core',
+    'format_timedelta': 'core',
+    'is_escalated': 'core',
+    'main': 'cli',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        return getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,6 @@
+import sys
+from .cli import main
+
+# Guarded so process-pool workers (spawn) that re-import the main module don't rerun the report
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+import os
+import json
+import time
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from .core import shared_mode
+
+
+store_dir = "case_store"
+
+META_FILE = "meta.json"
+CURRENT_FILE = "CURRENT"   # name of the generation readers should open
+STORE_VERSION = 2
+
+# Superseded generations are removed once they are this old (seconds), so a reader
+# that just resolved CURRENT still finds its files
+STALE_AFTER = 60
+OPEN_ATTEMPTS = 3
+
+
+def _column_file(directory, index):
+    # Column names contain spaces and brackets, so files are numbered instead
+    return os.path.join(directory, f"col_{index:03d}.bin")
+
+
+def _source_signature(source_path, sheet_name):
+    stat = os.stat(source_path)
+    return {"source": os.path.abspath(source_path), "sheet": sheet_name,
+            "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def current_generation(directory=store_dir):
+    """Path of the generation CURRENT points to, or None if no store was published yet."""
+    try:
+        with open(os.path.join(directory, CURRENT_FILE), encoding="utf-8") as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return os.path.join(directory, name) if name else None
+
+
+def _remove_stale(directory):
+    """Drop superseded generations and leftovers of interrupted writers, once older than STALE_AFTER."""
+    current = current_generation(directory)
+    keep = {CURRENT_FILE, os.path.basename(current) if current else None}
+    cutoff = time.time() - STALE_AFTER
+    for name in os.listdir(directory):
+        if name in keep:
+            continue
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) > cutoff:
+                continue
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
+        except OSError:
+            pass  # already removed by another writer, or still mapped on Windows
+
+
+def source_signature(source_path, sheet_name="Sheet1", extra_sources=()):
+    """Path, sheet, size and mtime of every source; any change means the store is stale."""
+    signature = [_source_signature(path, sheet) for path, sheet in [(source_path, sheet_name)] + list(extra_sources)]
+    return signature if extra_sources else signature[0]
+
+
+def write_store(df, directory=store_dir, signature=None):
+    """
+    Write df as a new store generation, one flat binary file per column:
+    - datetime columns -> int64 (NaT stored as int64 min)
+    - text columns     -> codes (-1 for missing) + sorted dictionary in meta.json,
+                          in the integer width pd.Categorical uses, so reopening never casts
+    - numeric columns  -> raw array in their own dtype
+
+    Each writer fills its own uniquely named generation directory, then publishes it by
+    renaming a new CURRENT file over the old one. Concurrent writers never touch each
+    other's files, and readers always see a complete generation. Returns its path.
+    """
+    os.makedirs(directory, exist_ok=True)
+    generation = tempfile.mkdtemp(prefix="gen-", dir=directory)
+    os.chmod(generation, shared_mode(0o777))
+
+    columns = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            unit = np.datetime_data(series.dtype)[0]
+            values = series.to_numpy().view(np.int64)
+            entry = {"name": col, "kind": "datetime", "dtype": "int64", "unit": unit}
+        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy()
+            entry = {"name": col, "kind": "numeric", "dtype": values.dtype.str}
+        else:
+            codes, categories = pd.factorize(series.map(str, na_action="ignore"), sort=True, use_na_sentinel=True)
+            values = pd.Categorical.from_codes(codes, categories=categories).codes
+            entry = {"name": col, "kind": "category", "dtype": values.dtype.str,
+                     "categories": list(categories)}
+
+        values = np.ascontiguousarray(values)
+        out = np.memmap(_column_file(generation, i), dtype=values.dtype, mode="w+", shape=values.shape)
+        out[:] = values
+        out.flush()
+        del out
+        columns.append(entry)
+
+    meta = {"version": STORE_VERSION, "rows": len(df), "columns": columns, "signature": signature}
+    with open(os.path.join(generation, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+    fd, pointer = tempfile.mkstemp(prefix=CURRENT_FILE + ".", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(os.path.basename(generation))
+    os.chmod(pointer, shared_mode())
+    os.replace(pointer, os.path.join(directory, CURRENT_FILE))
+
+    _remove_stale(directory)
+    return generation
+
+
+def read_meta(generation):
+    try:
+        with open(os.path.join(generation, META_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def open_store(directory=store_dir, categorical=False):
+    """
+    Open the current store generation as a DataFrame backed by read-only np.memmap arrays.
+
+    Numeric and datetime columns are handed to pandas without a copy, so processes
+    that open the same store share those pages through the OS page cache.
+    With categorical=True text columns are pd.Categorical over the mapped codes
+    (shared as well); otherwise they are decoded into per-process object arrays,
+    matching what pd.read_excel returns.
+    """
+    for attempt in range(OPEN_ATTEMPTS):
+        generation = current_generation(directory)
+        if generation is None:
+            raise FileNotFoundError(f"No case store in {directory}")
+        try:
+            meta = read_meta(generation)
+            if meta is None:
+                raise FileNotFoundError(f"Case store generation {generation} was removed")
+            return _open_generation(generation, meta, categorical)
+        except FileNotFoundError:
+            if attempt == OPEN_ATTEMPTS - 1:
+                raise
+
+
+def _open_generation(generation, meta, categorical):
+    rows = meta["rows"]
+    data = {}
+    for i, entry in enumerate(meta["columns"]):
+        if rows == 0:
+            values = np.zeros(0, dtype=entry["dtype"])
+        else:
+            values = np.memmap(_column_file(generation, i), dtype=entry["dtype"], mode="r", shape=(rows,))
+
+        if entry["kind"] == "datetime":
+            data[entry["name"]] = values.view(f"datetime64[{entry['unit']}]")
+        elif entry["kind"] == "category":
+            categories = pd.Index(entry["categories"], dtype=object)
+            if categorical:
+                data[entry["name"]] = pd.Categorical.from_codes(values, categories=categories)
+            else:
+                decoded = np.asarray(categories, dtype=object).take(values, mode="clip")
+                decoded[np.asarray(values) == -1] = np.nan
+                data[entry["name"]] = decoded
+        else:
+            data[entry["name"]] = values
+
+    # copy=False keeps every block a view of its memmap (the default copies dict input)
+    return pd.DataFrame(data, columns=[entry["name"] for entry in meta["columns"]], copy=False)
+
+
+def load_cases(source_path, sheet_name="Sheet1", directory=store_dir, categorical=False, extra_sources=(),
+               use_processes=True):
+    """
+    Open the case store, rebuilding it from the workbook first if the workbook
+    changed (size or mtime) since the store was written.
+
+    extra_sources: additional (path, sheet_name) pairs, read concurrently with the
+    master sheet and unioned into the same store (see ingestion.read_sources);
+    use_processes picks a process pool (default) or threads for those reads.
+    """
+    sources = [(source_path, sheet_name)] + list(extra_sources)
+    signature = source_signature(source_path, sheet_name, extra_sources)
+
+    # Meta and column files always come from the same generation. A generation superseded
+    # long enough ago can be cleaned up between resolving CURRENT and mapping it: resolve again.
+    for attempt in range(OPEN_ATTEMPTS):
+        generation = current_generation(directory)
+        meta = read_meta(generation) if generation else None
+        if meta is None or meta.get("version") != STORE_VERSION or meta.get("signature") != signature:
+            if extra_sources:
+                from .ingestion import read_sources
+                df = read_sources(sources, use_processes=use_processes)
+            else:
+                df = pd.read_excel(source_path, sheet_name=sheet_name)
+            generation = write_store(df, directory, signature=signature)
+            meta = read_meta(generation)
+        try:
+            return _open_generation(generation, meta, categorical)
+        except FileNotFoundError:
+            if attempt == OPEN_ATTEMPTS - 1:
+                raise
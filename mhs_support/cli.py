@@ -0,0 +1,153 @@
+import os
+import re
+import sys
+import time
+import argparse
+import subprocess
+
+from . import config
+from .watch import POLL_INTERVAL, DEBOUNCE, subprocess_env
+
+
+# Wall-clock budgets (seconds) checked by --startup-check
+HELP_BUDGET = 0.3       # `--help` must not import pandas/numpy
+SECTION_BUDGET = 1.5    # one section from a warm case store, no Excel export
+
+
+# Section 21 period formats, checked before anything heavy is imported
+PERIOD_FORMATS = {
+    'M': re.compile(r"^\d{4}-(0[1-9]|1[0-2])$"),
+    'Q': re.compile(r"^\d{4}Q[1-4]$", re.IGNORECASE),
+}
+
+
+def period_freq(value):
+    """'M' for "2025-09", 'Q' for "2025Q3", None for anything else."""
+    value = str(value).strip()
+    return next((freq for freq, pattern in PERIOD_FORMATS.items() if pattern.match(value)), None)
+
+
+def check_periods(compare, baseline):
+    """Error message for a bad Section 21 period pair, or None. The default current period is a month."""
+    for label, value in (("--compare", compare), ("--baseline", baseline)):
+        if value and period_freq(value) is None:
+            return f'{label} {value!r} is not a period; use a month like "2025-09" or a quarter like "2025Q3".'
+    current_freq = period_freq(compare) if compare else 'M'
+    if baseline and period_freq(baseline) != current_freq:
+        return f"--baseline {baseline!r} and the compared period {compare or '(latest month)'!r} must both be months or both quarters."
+    return None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="mhs_support",
+        description="L2 platform support case report: prints every section and exports them to Excel.",
+    )
+    parser.add_argument("--file", default=config.file_path, help="master workbook (default: %(default)s)")
+    parser.add_argument("--output", default=config.output_path, help="Excel output (default: %(default)s)")
+    parser.add_argument("--section", action="append", metavar="KEY",
+                        help="only run this section, e.g. 4 or 4.1 (repeatable); implies --no-export")
+    parser.add_argument("--list-sections", action="store_true", help="list section keys and exit")
+    parser.add_argument("--no-export", action="store_true", help="print only, don't write the Excel output")
+    parser.add_argument("--compare", metavar="PERIOD", help='Section 21 period, e.g. "2025-09" or "2025Q3"')
+    parser.add_argument("--rollup", nargs="+", metavar="DIM",
+                        help='print a 1-3 dimension roll-up from the saved pivot cube, e.g. --rollup Platform "Worked By"')
+    parser.add_argument("--baseline", metavar="PERIOD", help="Section 21 baseline period (default: the period before)")
+
+    watch_group = parser.add_argument_group("watch mode")
+    watch_group.add_argument("--watch", action="store_true", help="regenerate the report whenever the workbook changes")
+    watch_group.add_argument("--interval", type=float, default=POLL_INTERVAL, help="poll interval in seconds")
+    watch_group.add_argument("--debounce", type=float, default=DEBOUNCE, help="quiet period before rerunning, in seconds")
+    watch_group.add_argument("--run-now", action="store_true", help="generate the report once at startup")
+
+    parser.add_argument("--startup-check", action="store_true",
+                        help=f"time --help (budget {HELP_BUDGET}s) and a single-section run (budget {SECTION_BUDGET}s)")
+    return parser
+
+
+def _timed_run(args):
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "mhs_support"] + args, env=subprocess_env(),
+                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    return time.perf_counter() - started
+
+
+def startup_check(file_path):
+    """Measure startup for --help and a single-section run against their budgets; returns an exit code."""
+    file_path = os.path.abspath(file_path)
+    checks = [
+        ("--help", ["--help"], HELP_BUDGET),
+        ("--section 1", ["--file", file_path, "--section", "1"], SECTION_BUDGET),
+    ]
+    try:
+        # Warm the case store and subject model first, so the section run measures a normal reopen
+        _timed_run(["--file", file_path, "--section", "1"])
+
+        exit_code = 0
+        for label, args, budget in checks:
+            elapsed = min(_timed_run(args) for _ in range(3))
+            status = "OK" if elapsed <= budget else "OVER BUDGET"
+            print(f"{label:<14} {elapsed:6.2f}s  (budget {budget:.1f}s)  {status}")
+            if elapsed > budget:
+                exit_code = 1
+        return exit_code
+    except subprocess.CalledProcessError as e:
+        print(f"Startup check failed: `{' '.join(e.cmd[1:])}` exited with {e.returncode}", file=sys.stderr)
+        if e.stderr and e.stderr.strip():
+            print(e.stderr.strip().splitlines()[-1], file=sys.stderr)
+        return e.returncode or 1
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.startup_check:
+        return startup_check(args.file)
+
+    if args.watch:
+        from .watch import watch
+        watch(args.file, interval=args.interval, debounce=args.debounce, run_now=args.run_now)
+        return 0
+
+    if args.compare:
+        config.compare_period = args.compare
+    if args.baseline:
+        config.compare_baseline = args.baseline
+    period_error = check_periods(config.compare_period, config.compare_baseline)
+    if period_error:
+        print(period_error, file=sys.stderr)
+        return 2
+
+    # Heavy imports (pandas, numpy) start here
+    if args.rollup:
+        from .cube import load_cube, rollup, cube_path
+        from .report import print_table
+        if len(args.rollup) > 3:
+            print("--rollup takes at most 3 dimensions.", file=sys.stderr)
+            return 2
+        try:
+            table = rollup(load_cube(cube_path), args.rollup)
+        except FileNotFoundError:
+            print(f"No pivot cube at {cube_path}; run the full report (or --section 22) first.", file=sys.stderr)
+            return 2
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+        print_table(table, f"ROLL-UP: {' x '.join(args.rollup)}", show_index=False)
+        return 0
+
+    from .report import SECTIONS, run
+
+    if args.list_sections:
+        for key, (title, _) in SECTIONS.items():
+            print(f"{key:>5}  {title}")
+        return 0
+
+    unknown = [key for key in args.section or [] if key not in SECTIONS]
+    if unknown:
+        print(f"Unknown section(s): {', '.join(unknown)}. Use --list-sections.", file=sys.stderr)
+        return 2
+
+    run(sections=args.section, export=not (args.no_export or args.section),
+        output_path=args.output, file_path=args.file)
+    return 0
@@ -0,0 +1,33 @@
+# Report settings. Kept free of heavy imports so `--help` stays fast.
+
+file_path = "L2 Platform Support Master Data.xlsx"
+sheet_name = "Sheet1"
+output_path = "analysis_output.xlsx"
+
+# Extra (workbook, sheet) sources unioned with Sheet1, e.g. ("L2 Region EU.xlsx", "Sheet1")
+extra_sources = []
+
+# Parse extra_sources in a process pool (True) or threads (False); openpyxl is CPU-bound
+read_with_processes = True
+
+# Accounts left out of the customer rankings (Section 4)
+excluded_customers = ("Multi-Health Systems Inc.", "MHS Case Temp")
+
+# Rolling windows (days) for the recent top customers (Section 4.1)
+customer_windows = [30, 90]
+
+# Period comparison (Section 21): "2025-09" or "2025Q3"; None = latest month vs the month before
+compare_period = None
+compare_baseline = None
+
+# Platform groups for Section 19; also the list of known platforms for the data-quality checks
+group_definitions = {
+    'MAC+': ['MAC+'], 'TAP': ['TAP'], 'MGI': ['MGI'], 'GIFR': ['GIFR'], 'USB': ['USB'],
+    'GEARS': ['GEARS'], 'LMS': ['LMS'], 'FAS': ['FAS'], 'CORE PATHWAY': ['CORE SOLUTIONS'],
+    'RLH Online': ['RLH ONLINE'], 'Online Storefront (Shopify)': ['ONLINE STOREFRONT (SHOPIFY)'],
+    'API Integration (Janus)': ['API INTEGRATION (JANUS)']
+}
+
+# Section 19 special-request period
+special_period_start = "2025-04-01"
+special_period_end = "2025-09-30"
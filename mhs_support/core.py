@@ -0,0 +1,107 @@
+import os
+import re
+import stat
+import tempfile
+from contextlib import contextmanager
+from datetime import timedelta
+import numpy as np
+import pandas as pd
+
+
+def business_timedelta(start, end):
+    """
+    Calculate timedelta excluding weekends (Saturday, Sunday).
+    """
+    if pd.isna(start) or pd.isna(end):
+        return pd.NaT
+
+    start_date = start.date()
+    end_date = end.date()
+
+    # Same-day case
+    if start_date == end_date:
+        if start.weekday() < 5:  # Mon–Fri
+            return end - start
+        else:
+            return timedelta(0)
+
+    # Count weekdays INCLUDING the end date if it's Mon–Fri
+    weekdays = np.busday_count(start_date, end_date)
+    if end.weekday() < 5:
+        weekdays += 1
+
+    # Remove 2 since we’ll handle the first and last day separately
+    full_days = max(weekdays - 2, 0)
+
+    # Partial first day
+    end_of_start_day = pd.Timestamp.combine(start_date, pd.Timestamp.max.time()).replace(
+        hour=23, minute=59, second=59
+    )
+    partial_first = (end_of_start_day - start).total_seconds()
+    if start.weekday() >= 5:  # weekend start
+        partial_first = 0
+
+    # Partial last day
+    start_of_end_day = pd.Timestamp.combine(end_date, pd.Timestamp.min.time())
+    partial_last = (end - start_of_end_day).total_seconds()
+    if end.weekday() >= 5:  # weekend end
+        partial_last = 0
+
+    total_secs = int(full_days * 86400 + partial_first + partial_last)  # cast to int
+    return timedelta(seconds=total_secs)
+
+
+# Trim case title
+def normalize_title(title):
+    if pd.isna(title):
+        return ""
+    title = title.lower().strip()
+    title = re.sub(r'\s+', ' ', title)
+    title = re.sub(r'\s*\+\s*', '+', title)
+    return title
+
+
+def format_timedelta(td):
+    if pd.isna(td):
+        return "N/A"
+    total_seconds = int(td.total_seconds())
+    return str(timedelta(seconds=total_seconds))
+
+
+def is_escalated(series):
+    return series.astype(str).str.strip().str.lower() == 'yes'
+
+
+def shared_mode(mode=0o666):
+    """
+    mode with the process umask applied, i.e. what open()/mkdir() would create.
+    tempfile creates 0600 files / 0700 directories, which other accounts can't read.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return mode & ~umask
+
+
+@contextmanager
+def atomic_output(path):
+    """
+    Yield a unique temp path next to path. On success it is renamed over path, keeping the
+    existing file's mode (or the umask default) rather than tempfile's 0600; on any error
+    it is removed. Readers never see a half-written file and concurrent writers never share one.
+    """
+    root, ext = os.path.splitext(path)
+    tmp = tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or ".",
+                                      prefix=os.path.basename(root) + ".tmp-", suffix=ext, delete=False)
+    tmp.close()
+    try:
+        yield tmp.name
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = shared_mode()
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        if os.path.exists(tmp.name):
+            os.remove(tmp.name)
+        raise
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+from .core import is_escalated, atomic_output
+
+
+cube_path = "pivot_cube.csv"
+
+DIMENSIONS = ['Platform', 'Subject', 'Priority', 'Worked By', 'Year-Month', 'Escalated']
+BLANK = "(blank)"
+
+# Resolution-time sketch: case counts per business-hour bin (lower, upper]. Mergeable by summing;
+# bins are right-closed and the edges include Section 15's boundaries (12h, 24h, 3d, 7d),
+# so those ranges (<= 12h, 12-24h, ...) stay exact.
+SKETCH_EDGES = np.array([0, 0.25, 0.5, 1, 2, 4, 8, 12, 24, 48, 72, 120, 168, 336, 720, np.inf])
+SKETCH_COLUMNS = [f"Res Bin {i:02d}" for i in range(len(SKETCH_EDGES) - 1)]
+
+MEASURES = ['Case Count', 'Escalated Count', 'Resolved Count', 'Resolution Hours Sum'] + SKETCH_COLUMNS
+
+
+def build_cube(df, resolution_hours):
+    """
+    One grouped pass over all dimensions at once. Only non-empty cells are kept,
+    so any roll-up over a subset of dimensions is a sum over these cells.
+    """
+    hours = pd.Series(resolution_hours).reindex(df.index).to_numpy(dtype=float)
+    resolved = ~np.isnan(hours)
+
+    cells = pd.DataFrame({
+        dim: df[dim].astype(object).where(df[dim].notna(), BLANK).astype(str)
+        for dim in DIMENSIONS if dim != 'Escalated'
+    }, index=df.index)
+    escalated = is_escalated(df['Escalated'])
+    cells['Escalated'] = np.where(escalated, 'Yes', 'No')
+
+    cells['Case Count'] = 1
+    cells['Escalated Count'] = escalated.astype(int)
+    cells['Resolved Count'] = resolved.astype(int)
+    cells['Resolution Hours Sum'] = np.where(resolved, hours, 0.0)
+
+    # One-hot sketch bin per resolved case; side='left' puts a value equal to an edge in the bin it closes
+    bins = np.searchsorted(SKETCH_EDGES, np.where(resolved, hours, 0.0), side='left') - 1
+    sketch = np.zeros((len(cells), len(SKETCH_COLUMNS)), dtype=np.int64)
+    sketch[np.flatnonzero(resolved), bins[resolved].clip(0, len(SKETCH_COLUMNS) - 1)] = 1
+    cells[SKETCH_COLUMNS] = sketch
+
+    return cells.groupby(DIMENSIONS, sort=True, observed=True)[MEASURES].sum().reset_index()
+
+
+def save_cube(cube, path=cube_path):
+    # Temp file + rename, so a --rollup running meanwhile never sums a partial cube
+    with atomic_output(path) as tmp_path:
+        cube.to_csv(tmp_path, index=False)
+
+
+def load_cube(path=cube_path):
+    return pd.read_csv(path, dtype={dim: str for dim in DIMENSIONS}, keep_default_na=False)
+
+
+def sketch_quantile(sketch, q):
+    """Approximate quantile (hours) from sketch counts, interpolating inside the bin."""
+    total = sketch.sum()
+    if total == 0:
+        return np.nan
+    cumulative = np.cumsum(sketch)
+    i = int(np.searchsorted(cumulative, q * total))
+    lower, upper = SKETCH_EDGES[i], SKETCH_EDGES[i + 1]
+    if np.isinf(upper):
+        return lower
+    before = cumulative[i - 1] if i > 0 else 0
+    return lower + (upper - lower) * (q * total - before) / sketch[i]
+
+
+def rollup(cube, dimensions, filters=None):
+    """
+    Answer a 1-3 dimension roll-up by summing cube cells.
+    filters: optional {dimension: value or list of values} applied before summing.
+    """
+    unknown = [d for d in dimensions if d not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Unknown dimension(s) {unknown}; choose from {DIMENSIONS}")
+
+    for dim, values in (filters or {}).items():
+        values = [values] if isinstance(values, str) else list(values)
+        cube = cube[cube[dim].isin(values)]
+
+    table = cube.groupby(list(dimensions), sort=True)[MEASURES].sum()
+    sketches = table[SKETCH_COLUMNS].to_numpy()
+
+    table['Escalation Rate'] = (table['Escalated Count'] / table['Case Count'] * 100).round(1)
+    table['Avg Resolution Hours'] = (table['Resolution Hours Sum'] / table['Resolved Count'].where(table['Resolved Count'] > 0)).round(1)
+    table['P50 Resolution Hours'] = np.round([sketch_quantile(s, 0.5) for s in sketches], 1)
+    table['P90 Resolution Hours'] = np.round([sketch_quantile(s, 0.9) for s in sketches], 1)
+
+    columns = ['Case Count', 'Escalated Count', 'Escalation Rate', 'Resolved Count',
+               'Avg Resolution Hours', 'P50 Resolution Hours', 'P90 Resolution Hours']
+    return table[columns].sort_values('Case Count', ascending=False).reset_index()
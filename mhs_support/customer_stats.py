@@ -0,0 +1,112 @@
+import heapq
+import pandas as pd
+from . import config
+
+
+# Internal / placeholder accounts left out of customer rankings
+DEFAULT_EXCLUDED_CUSTOMERS = tuple(config.excluded_customers)
+
+
+class CustomerCounts:
+    """
+    Per-platform customer case counts that can be updated incrementally
+    (add/remove batches of rows) and queried for the top-K customers with a heap.
+    """
+
+    def __init__(self, excluded=DEFAULT_EXCLUDED_CUSTOMERS):
+        self.excluded = set(excluded)
+        self.counts = {}          # platform -> {customer: count}
+        self.overall = {}         # customer -> count across all platforms
+
+    def _batch(self, platforms, customers):
+        batch = pd.DataFrame({'Platform': platforms, 'Customer': customers}).dropna()
+        batch = batch[~batch['Customer'].isin(self.excluded)]
+        return batch.groupby(['Platform', 'Customer']).size()
+
+    def _update(self, platform, customer, delta):
+        platform_counts = self.counts.setdefault(platform, {})
+        for counts in (platform_counts, self.overall):
+            new_count = counts.get(customer, 0) + delta
+            if new_count > 0:
+                counts[customer] = new_count
+            else:
+                counts.pop(customer, None)
+        if not platform_counts:
+            del self.counts[platform]
+
+    def add(self, platforms, customers):
+        for (platform, customer), n in self._batch(platforms, customers).items():
+            self._update(platform, customer, n)
+
+    def remove(self, platforms, customers):
+        for (platform, customer), n in self._batch(platforms, customers).items():
+            self._update(platform, customer, -n)
+
+    def platforms(self):
+        return sorted(self.counts)
+
+    def top_k(self, k, platform=None):
+        """
+        [(customer, count), ...] for the k busiest customers of a platform
+        (or all platforms when platform is None). Ties go alphabetically.
+        """
+        counts = self.overall if platform is None else self.counts.get(platform, {})
+        return heapq.nsmallest(k, counts.items(), key=lambda item: (-item[1], item[0]))
+
+
+class RollingCustomerCounts(CustomerCounts):
+    """
+    CustomerCounts over a sliding window of `days` ending at a moving timestamp.
+    Moving the window forward only adds the rows that entered it and removes
+    the rows that fell out, instead of recounting the whole frame.
+    """
+
+    def __init__(self, df, days, excluded=DEFAULT_EXCLUDED_CUSTOMERS, time_col='Entered Queue'):
+        super().__init__(excluded)
+        self.window = pd.Timedelta(days=days)
+        rows = df[df[time_col].notna()].sort_values(time_col, kind='stable')
+        self._times = rows[time_col].to_numpy()
+        self._platforms = rows['Platform'].to_numpy()
+        self._customers = rows['Customer'].to_numpy()
+        self._lo = 0   # first row inside the window
+        self._hi = 0   # first row after the window
+        self.end = None
+
+    def advance(self, end):
+        """Move the window to (end - days, end]. Moving backwards rebuilds from scratch."""
+        end = pd.Timestamp(end)
+        if self.end is not None and end < self.end:
+            self.counts, self.overall = {}, {}
+            self._lo = self._hi = 0
+
+        new_hi = self._times.searchsorted(end.to_datetime64(), side='right')
+        new_lo = self._times.searchsorted((end - self.window).to_datetime64(), side='right')
+
+        if new_hi > self._hi:
+            start = max(self._hi, new_lo)
+            self.add(self._platforms[start:new_hi], self._customers[start:new_hi])
+        if new_lo > self._lo:
+            stop = min(new_lo, self._hi)
+            self.remove(self._platforms[self._lo:stop], self._customers[self._lo:stop])
+
+        self._lo, self._hi, self.end = new_lo, new_hi, end
+        return self
+
+
+def top_customers_table(counts, k, platform_totals=None):
+    """
+    Top-k customers per platform as a Section 4 style table.
+    Percentage is relative to platform_totals (defaults to the counted cases).
+    """
+    rows = []
+    for platform in counts.platforms():
+        for customer, n in counts.top_k(k, platform):
+            rows.append({"Platform": platform, "Customer": customer, "Case Count": n})
+    table = pd.DataFrame(rows, columns=["Platform", "Customer", "Case Count"])
+
+    if platform_totals is None:
+        platform_totals = pd.Series({p: sum(c.values()) for p, c in counts.counts.items()})
+    table['Percentage'] = (
+        table['Case Count'] / table['Platform'].map(platform_totals) * 100
+    ).round(1).astype(str) + '%'
+    return table
@@ -0,0 +1,52 @@
+import pandas as pd
+
+
+DATE_COLUMNS = ['Entered Queue', 'Resolution Date']
+
+# Rows with the same case number entering the queue at the same time are the same row
+DUPLICATE_KEY = ['Case Number', 'Entered Queue']
+
+
+def _is_blank(series):
+    return series.isna() | (series.astype(str).str.strip() == "")
+
+
+def validate_cases(df, group_definitions):
+    """
+    Run every data-quality rule over the raw frame (before date coercion).
+    Returns a boolean DataFrame (one column per rule) aligned to df.index.
+    """
+    known_platforms = {p for platforms in group_definitions.values() for p in platforms}
+    dates = {col: pd.to_datetime(df[col], errors='coerce') for col in DATE_COLUMNS}
+
+    checks = {}
+    for col in DATE_COLUMNS:
+        # Present in the sheet but not a date; blank Resolution Date just means still open
+        checks[f'Unparseable {col}'] = ~_is_blank(df[col]) & dates[col].isna()
+    checks['Missing Entered Queue'] = _is_blank(df['Entered Queue'])
+    checks['Resolved Before Entered'] = dates['Resolution Date'] < dates['Entered Queue']
+    checks['Unknown Platform'] = ~df['Platform'].astype(str).str.strip().str.upper().isin(known_platforms)
+    checks['Blank Worked By'] = _is_blank(df['Worked By'])
+    checks['Duplicated Case Row'] = df.duplicated(subset=DUPLICATE_KEY, keep='first')
+
+    return pd.DataFrame(checks, index=df.index)
+
+
+def quarantine_table(df, issues):
+    """Rows failing at least one rule, with an 'Issues' column listing the failed rules."""
+    flagged = issues.any(axis=1)
+    failed = issues[flagged]
+    names = failed.columns.to_numpy()
+    labels = [", ".join(names[row]) for row in failed.to_numpy()]
+    return df[flagged].assign(Issues=labels)
+
+
+def issue_counts(issues):
+    """Row count and percentage of total rows per rule, plus the number of rows with any issue."""
+    counts = issues.sum().rename_axis('Check').reset_index(name='Row Count')
+    any_row = pd.DataFrame([{"Check": "Rows with any issue", "Row Count": int(issues.any(axis=1).sum())}])
+    counts = pd.concat([counts, any_row], ignore_index=True)
+
+    total_rows = max(len(issues), 1)
+    counts["Percentage"] = (counts["Row Count"] / total_rows * 100).round(1).astype(str) + "%"
+    return counts
@@ -0,0 +1,175 @@
+import math
+import numpy as np
+import pandas as pd
+from .core import is_escalated, business_timedelta
+
+
+CATEGORICAL_FEATURES = ['Platform', 'Subject', 'Priority']
+
+# Pseudo-cases pulling a customer's escalation rate towards the overall rate
+CUSTOMER_SMOOTHING = 10
+L2_PENALTY = 1.0
+MAX_ITER = 25
+
+
+def _category_values(df, col):
+    return df[col].astype(object).where(df[col].notna(), 'Missing').astype(str).str.strip()
+
+
+_erfc = np.vectorize(math.erfc, otypes=[float])
+
+
+def _norm_cdf(x):
+    return 0.5 * _erfc(-np.asarray(x, dtype=float) / math.sqrt(2))
+
+
+def _one_hot(codes, width):
+    """Dense one-hot block from integer codes; unknown (-1) rows stay all zero."""
+    block = np.zeros((len(codes), width))
+    known = codes >= 0
+    block[np.flatnonzero(known), codes[known]] = 1.0
+    return block
+
+
+class EscalationRiskModel:
+    """
+    Two linear models over the same case features:
+    - logistic regression (Newton / IRLS) for P(escalation)
+    - ridge regression on log1p(resolution hours), with the residual spread, for the
+      resolution time (log-normal), so the expectation can be conditioned on how long a
+      case has already been open
+
+    Features: one-hot Platform, Subject, Priority, entry hour and weekday, plus the
+    customer's historical (smoothed) escalation rate and log case volume.
+    """
+
+    def __init__(self, l2=L2_PENALTY, smoothing=CUSTOMER_SMOOTHING):
+        self.l2 = l2
+        self.smoothing = smoothing
+        self.categories_ = {}
+        self.customer_stats_ = None
+        self.base_rate_ = None
+        self.escalation_coef_ = None
+        self.resolution_coef_ = None
+        self.resolution_sigma_ = None
+
+    def _customer_features(self, df, y=None):
+        customers = _category_values(df, 'Customer')
+        stats = self.customer_stats_.reindex(customers.values)
+        cases = stats['cases'].fillna(0).to_numpy()
+        escalated = stats['escalated'].fillna(0).to_numpy()
+
+        # Leave-one-out on training rows so a case never sees its own label
+        if y is not None:
+            cases = cases - 1
+            escalated = escalated - y
+
+        m = self.smoothing
+        rate = (escalated + self.base_rate_ * m) / (cases + m)
+        volume = np.log1p(cases) / np.log1p(self.customer_stats_['cases'].max())
+        return np.column_stack([rate, volume])
+
+    def _design_matrix(self, df, y=None):
+        blocks = [np.ones((len(df), 1))]
+        for col in CATEGORICAL_FEATURES:
+            categories = self.categories_[col]
+            blocks.append(_one_hot(categories.get_indexer(_category_values(df, col)), len(categories)))
+
+        entered = df['Entered Queue']
+        blocks.append(_one_hot(entered.dt.hour.fillna(-1).astype(int).to_numpy(), 24))
+        blocks.append(_one_hot(entered.dt.weekday.fillna(-1).astype(int).to_numpy(), 7))
+        blocks.append(self._customer_features(df, y))
+        return np.hstack(blocks)
+
+    def _penalty(self, n_features):
+        penalty = np.full(n_features, self.l2)
+        penalty[0] = 0.0  # don't shrink the intercept
+        return penalty
+
+    def fit(self, history, resolution_hours):
+        """
+        history: cases whose outcome is known (resolved)
+        resolution_hours: business resolution hours aligned to history's index (NaN if unknown)
+        """
+        y = is_escalated(history['Escalated']).to_numpy(dtype=float)
+
+        for col in CATEGORICAL_FEATURES:
+            self.categories_[col] = pd.Index(_category_values(history, col).unique())
+
+        customers = _category_values(history, 'Customer')
+        self.customer_stats_ = pd.DataFrame({'cases': 1, 'escalated': y}, index=customers.values).groupby(level=0).sum()
+        self.base_rate_ = y.mean()
+
+        X = self._design_matrix(history, y)
+        penalty = self._penalty(X.shape[1])
+
+        # Logistic regression via Newton steps on the full batch
+        coef = np.zeros(X.shape[1])
+        for _ in range(MAX_ITER):
+            p = 1 / (1 + np.exp(-(X @ coef)))
+            gradient = X.T @ (p - y) + penalty * coef
+            hessian = (X * (p * (1 - p))[:, None]).T @ X + np.diag(penalty)
+            step = np.linalg.solve(hessian, gradient)
+            coef -= step
+            if np.abs(step).max() < 1e-6:
+                break
+        self.escalation_coef_ = coef
+
+        # Ridge regression on log hours, closed form
+        hours = pd.Series(resolution_hours).reindex(history.index).to_numpy(dtype=float)
+        known = ~np.isnan(hours) & (hours >= 0)
+        Xr, target = X[known], np.log1p(hours[known])
+        self.resolution_coef_ = np.linalg.solve(Xr.T @ Xr + np.diag(penalty), Xr.T @ target)
+        self.resolution_sigma_ = max(float(np.std(target - Xr @ self.resolution_coef_)), 1e-6)
+        return self
+
+    def score(self, cases, elapsed_hours=None):
+        """
+        Score every row of cases in one pass; returns the estimates aligned to cases.index.
+
+        elapsed_hours: business hours each case has been open so far (0 if not given).
+        With u = log1p(hours) ~ N(mu, sigma^2), the expected resolution time of a case
+        still open after e hours is E[exp(u) | u > log1p(e)] - 1 (a truncated log-normal
+        mean), which is never below e.
+        """
+        X = self._design_matrix(cases)
+        risk = 1 / (1 + np.exp(-(X @ self.escalation_coef_)))
+
+        elapsed = np.zeros(len(cases)) if elapsed_hours is None else \
+            pd.Series(elapsed_hours).reindex(cases.index).fillna(0).to_numpy(dtype=float).clip(min=0)
+        mu, sigma = X @ self.resolution_coef_, self.resolution_sigma_
+        a = np.log1p(elapsed)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            tail = np.exp(mu + sigma ** 2 / 2) * _norm_cdf((mu + sigma ** 2 - a) / sigma) / _norm_cdf((mu - a) / sigma)
+        # Far in the tail both probabilities underflow; the case is then expected to close about now
+        hours = np.maximum(np.where(np.isfinite(tail), tail - 1, elapsed), elapsed)
+
+        return pd.DataFrame({
+            'Escalation Risk': risk,
+            'Elapsed Hours': elapsed,
+            'Expected Resolution Hours': hours,
+            'Expected Remaining Hours': hours - elapsed,
+        }, index=cases.index)
+
+
+def score_open_cases(df, resolution_hours, as_of=None):
+    """
+    Fit on resolved cases and score the open queue (no Resolution Date, not yet escalated).
+    Elapsed time is counted in business hours up to as_of (default: the latest
+    timestamp in the data, i.e. when the export was taken).
+    Returns the open cases sorted by descending escalation risk.
+    """
+    resolved = df[df['Resolution Date'].notna()]
+    open_cases = df[df['Resolution Date'].isna() & ~is_escalated(df['Escalated'])]
+
+    if as_of is None:
+        as_of = max(df['Entered Queue'].max(), df['Resolution Date'].max())
+    elapsed_hours = open_cases['Entered Queue'].map(
+        lambda entered: business_timedelta(entered, as_of).total_seconds() / 3600 if pd.notna(entered) else np.nan
+    )
+
+    model = EscalationRiskModel().fit(resolved, resolution_hours)
+    scores = model.score(open_cases, elapsed_hours)
+
+    scored = open_cases[['Case Number', 'Platform', 'Subject', 'Priority', 'Customer', 'Entered Queue']].join(scores)
+    return scored.sort_values('Escalation Risk', ascending=False)
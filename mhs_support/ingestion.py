@@ -0,0 +1,106 @@
+import os
+import re
+import asyncio
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+# Columns support.py expects, in the order of the master Sheet1 export
+CASE_COLUMNS = [
+    '(Do Not Modify) Queue Item', '(Do Not Modify) Row Checksum', '(Do Not Modify) Modified On',
+    'Title', 'Platform', 'Entered Queue', 'Worked By', 'Priority', 'Case Number',
+    'Subject', 'Customer', 'Description', 'Resolution Date', 'Escalated',
+]
+
+# Header variants seen in regional / L3 exports -> master column name
+COLUMN_ALIASES = {
+    'case #': 'Case Number',
+    'case no': 'Case Number',
+    'case title': 'Title',
+    'owner': 'Worked By',
+    'resolved on': 'Resolution Date',
+    'escalated?': 'Escalated',
+    'account': 'Customer',
+}
+
+SOURCE_COLUMN = 'Source'
+
+
+def _header_key(name):
+    return re.sub(r'\s+', ' ', str(name)).strip().lower()
+
+
+_CANONICAL = {_header_key(col): col for col in CASE_COLUMNS}
+_CANONICAL.update(COLUMN_ALIASES)
+
+
+def _read_sheet(path, sheet_name):
+    # Module-level so it can be pickled for a process pool
+    return pd.read_excel(path, sheet_name=sheet_name)
+
+
+def align_to_schema(frame, source_label):
+    """Rename known header variants, drop unknown columns and add missing ones as empty."""
+    renamed = {col: _CANONICAL[_header_key(col)] for col in frame.columns if _header_key(col) in _CANONICAL}
+    frame = frame[list(renamed)].rename(columns=renamed)
+    frame = frame.loc[:, ~frame.columns.duplicated()]
+    frame = frame.reindex(columns=CASE_COLUMNS)
+    frame[SOURCE_COLUMN] = source_label
+    return frame
+
+
+def union_frames(frames):
+    """
+    Union aligned frames by allocating each output column once at the final length
+    and copying every part into its slice (instead of repeated pd.concat).
+    """
+    total_rows = sum(len(f) for f in frames)
+    columns = CASE_COLUMNS + [SOURCE_COLUMN]
+
+    data = {}
+    for col in columns:
+        parts = [f[col] for f in frames]
+        if parts and all(pd.api.types.is_datetime64_any_dtype(p) for p in parts):
+            out = np.empty(total_rows, dtype='datetime64[ns]')
+            convert = lambda p: p.to_numpy(dtype='datetime64[ns]')
+        else:
+            out = np.empty(total_rows, dtype=object)
+            convert = lambda p: p.astype(object).where(p.notna(), np.nan).to_numpy()
+
+        start = 0
+        for p in parts:
+            out[start:start + len(p)] = convert(p)
+            start += len(p)
+        data[col] = out
+
+    return pd.DataFrame(data, columns=columns)
+
+
+async def read_sources_async(sources, executor=None):
+    """Parse every (path, sheet_name) source concurrently; results keep the input order."""
+    loop = asyncio.get_running_loop()
+    tasks = [loop.run_in_executor(executor, _read_sheet, path, sheet) for path, sheet in sources]
+    return await asyncio.gather(*tasks)
+
+
+def read_sources(sources, use_processes=True, max_workers=None):
+    """
+    Read several sheets / workbooks concurrently and union them into one case frame.
+
+    sources: list of (path, sheet_name). Each row is tagged with 'path:sheet' in the Source column.
+    openpyxl parsing is pure Python and holds the GIL, so sources are parsed in a process
+    pool by default; use_processes=False falls back to threads (only overlaps file I/O).
+    """
+    sources = list(sources)
+    workers = min(max_workers or len(sources), os.cpu_count() or 1) if use_processes else max_workers or len(sources)
+    if workers <= 1:
+        # A single worker would only add pool start-up on top of the sequential parse
+        frames = [_read_sheet(path, sheet) for path, sheet in sources]
+    else:
+        pool = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool(max_workers=workers) as executor:
+            frames = asyncio.run(read_sources_async(sources, executor))
+
+    aligned = [align_to_schema(frame, f"{path}:{sheet}") for frame, (path, sheet) in zip(frames, sources)]
+    return union_frames(aligned)
@@ -0,0 +1,153 @@
+import os
+import pickle
+import hashlib
+import numpy as np
+import pandas as pd
+from .core import is_escalated, atomic_output
+
+
+baseline_dir = "baselines"
+
+# Dimensions compared between periods: table name -> grouping column
+COMPARE_DIMENSIONS = {
+    'Platform': 'Platform',
+    'Subject': 'Subject',
+    'Team Member': 'Worked By',
+}
+
+# Columns the period tables are computed from; a cached period is reused while these are unchanged
+SIGNATURE_COLUMNS = ['Case Number', 'Entered Queue', 'Resolution Date', 'Escalated'] + list(COMPARE_DIMENSIONS.values())
+
+METRICS = ['Case Count', 'Escalated Count', 'Escalation Rate', 'Resolution P50 Hours', 'Resolution P90 Hours']
+
+
+def to_period(value, freq=None):
+    """'2025-09' -> monthly period, '2025Q3' -> quarterly period."""
+    if isinstance(value, pd.Period):
+        return value
+    value = str(value).strip()
+    if freq is None:
+        freq = 'Q' if 'Q' in value.upper() else 'M'
+    return pd.Period(value, freq=freq)
+
+
+def period_cases(df, period, time_col='Entered Queue'):
+    return df[df[time_col].dt.to_period(period.freqstr[0]) == period]
+
+
+def period_tables(cases, resolution_hours):
+    """Section-style tables for one period: per dimension counts, escalation rate and resolution percentiles."""
+    cases = cases.assign(
+        _escalated=is_escalated(cases['Escalated']),
+        _hours=pd.Series(resolution_hours).reindex(cases.index),
+    )
+
+    tables = {}
+    for name, col in COMPARE_DIMENSIONS.items():
+        grouped = cases.groupby(col)
+        table = pd.DataFrame({
+            'Case Count': grouped.size(),
+            'Escalated Count': grouped['_escalated'].sum(),
+            'Resolution P50 Hours': grouped['_hours'].quantile(0.5),
+            'Resolution P90 Hours': grouped['_hours'].quantile(0.9),
+        })
+        table['Escalation Rate'] = table['Escalated Count'] / table['Case Count'] * 100
+        table.index.name = name
+        tables[name] = table[METRICS]
+    return tables
+
+
+def _baseline_path(period, directory):
+    return os.path.join(directory, f"{period.freqstr[0]}_{period}.pkl")
+
+
+def is_closed(df, period, time_col='Entered Queue'):
+    """A period is closed once the data runs past its end; only then are its tables final."""
+    return period.end_time < df[time_col].max()
+
+
+def period_signature(cases):
+    """
+    Row count + digest of the period's own rows (order-independent). Rows added to other
+    periods, e.g. when the workbook is replaced with a newer export, leave it unchanged.
+    """
+    row_hashes = np.sort(pd.util.hash_pandas_object(cases[SIGNATURE_COLUMNS], index=False).to_numpy())
+    return f"{len(cases)}:{hashlib.sha1(row_hashes.tobytes()).hexdigest()}"
+
+
+def save_baseline(period, tables, signature=None, directory=baseline_dir):
+    os.makedirs(directory, exist_ok=True)
+    with atomic_output(_baseline_path(period, directory)) as tmp_path:
+        pd.to_pickle({'signature': signature, 'tables': tables}, tmp_path)
+
+
+def load_baseline(period, signature=None, directory=baseline_dir):
+    """Stored tables for period, or None if missing or computed from different rows."""
+    path = _baseline_path(period, directory)
+    if not os.path.exists(path):
+        return None
+    try:
+        saved = pd.read_pickle(path)
+    except (EOFError, pickle.UnpicklingError, OSError):
+        return None  # truncated or unreadable: recomputed and rewritten by the caller
+    if not isinstance(saved, dict) or 'tables' not in saved or saved.get('signature') != signature:
+        return None
+    return saved['tables']
+
+
+def get_period_tables(df, period, resolution_hours, directory=baseline_dir, refresh=False):
+    """
+    Cached period tables. Only closed periods are cached (a period still filling up would be
+    stored half-counted), and a cache is reused only while the period's rows are unchanged.
+    """
+    cases = period_cases(df, period)
+    closed = is_closed(df, period)
+    signature = period_signature(cases) if closed else None
+    tables = load_baseline(period, signature, directory) if closed and not refresh else None
+    if tables is None:
+        tables = period_tables(cases, resolution_hours)
+        if closed:
+            save_baseline(period, tables, signature, directory)
+    return tables
+
+
+def delta_table(current, baseline):
+    """
+    Join current and baseline tables on their key and add changes:
+    absolute and % change for counts, percentage-point change for escalation
+    rate and absolute change for the resolution percentiles.
+    """
+    joined = current.join(baseline, how='outer', lsuffix=' (Current)', rsuffix=' (Baseline)')
+    for col in ['Case Count', 'Escalated Count']:
+        joined[[f'{col} (Current)', f'{col} (Baseline)']] = (
+            joined[[f'{col} (Current)', f'{col} (Baseline)']].fillna(0).astype(int)
+        )
+
+    delta = pd.DataFrame(index=joined.index)
+    for col in METRICS:
+        cur, base = joined[f'{col} (Current)'], joined[f'{col} (Baseline)']
+        delta[f'{col} (Baseline)'] = base
+        delta[f'{col} (Current)'] = cur
+        if col == 'Escalation Rate':
+            delta['Escalation Rate Change (pp)'] = cur - base
+        else:
+            delta[f'{col} Change'] = cur - base
+        if col == 'Case Count':
+            delta['Case Count Change %'] = ((cur - base) / base.where(base != 0) * 100).round(1)
+
+    delta = delta.round(1)
+    return delta.sort_values('Case Count (Current)', ascending=False).reset_index()
+
+
+def compare_periods(df, current, baseline, resolution_hours, directory=baseline_dir):
+    """
+    Delta tables (one per dimension) of period `current` against `baseline`.
+    Closed periods come from their cached tables while their rows are unchanged;
+    a period still in progress (usually the current one) is always recomputed.
+    """
+    current, baseline = to_period(current), to_period(baseline)
+    if current.freqstr[0] != baseline.freqstr[0]:
+        raise ValueError(f"Can't compare {current} with {baseline}: both must be months or both quarters")
+    current_tables = get_period_tables(df, current, resolution_hours, directory)
+    baseline_tables = get_period_tables(df, baseline, resolution_hours, directory)
+    return {name: delta_table(current_tables[name], baseline_tables[name]) for name in COMPARE_DIMENSIONS}
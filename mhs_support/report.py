@@ -0,0 +1,838 @@
+import os
+import re
+import math
+from datetime import timedelta
+from functools import cached_property
+import pandas as pd
+
+from . import config
+from .core import business_timedelta, normalize_title, format_timedelta, is_escalated, atomic_output
+from .case_store import load_cases
+from .data_quality import validate_cases, quarantine_table, issue_counts
+from .subject_classifier import fill_missing_subjects, predicted_subjects_table, MIN_CONFIDENCE
+
+
+FILLED_COLUMNS = ['Subject', 'Platform', 'Priority']
+
+
+class ReportData:
+    """
+    The cleaned case frame, plus intermediates shared by several sections.
+    Shared pieces are built on first use, so a single-section run only pays for what it needs.
+    """
+
+    def __init__(self, file_path=config.file_path, sheet_name=config.sheet_name, extra_sources=config.extra_sources):
+        # Parsed once into a memory-mapped store (case_store/), reopened instantly until the workbook changes
+        df = load_cases(file_path, sheet_name=sheet_name, extra_sources=extra_sources, categorical=True,
+                        use_processes=config.read_with_processes)
+
+        # Data-quality checks on the raw rows, before dates are coerced
+        self.dq_issues = validate_cases(df, config.group_definitions)
+        self.dq_summary = issue_counts(self.dq_issues)
+        self.dq_quarantine = quarantine_table(df, self.dq_issues)
+
+        # Duplicated rows are dropped; reversed intervals are kept as cases but left out of resolution times.
+        # Filtering copies every column out of the mapped store, so only do it when there is something to drop.
+        duplicated = self.dq_issues['Duplicated Case Row']
+        if duplicated.any():
+            df = df[~duplicated]
+        # Text stays categorical over the store's codes; only the columns filled in below are decoded
+        df[FILLED_COLUMNS] = df[FILLED_COLUMNS].astype('str')
+        self.reversed_interval = self.dq_issues['Resolved Before Entered'].reindex(df.index)
+
+        # Process datetime (the store already keeps parsed dates; coercing those again would copy them)
+        for col in ['Entered Queue', 'Resolution Date']:
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+
+        # Convert PST to EST
+        # time_columns = ['Entered Queue', 'Resolution Date']
+        # for col in time_columns:
+        #     df[col] = df[col] + pd.Timedelta(hours=3)
+
+        df['Normalized Title'] = df['Title'].apply(normalize_title)
+
+        # Fill empty Subjects from the title (model persisted in subject_model.npz)
+        df = fill_missing_subjects(df)
+
+        df['Platform'] = df['Platform'].fillna('Other')
+        df['Priority'] = df['Priority'].fillna('Normal')
+        df['Year-Month'] = df['Entered Queue'].dt.to_period('M').astype(str)
+        df['Day of Week'] = df['Entered Queue'].dt.day_name()
+        self.df = df
+
+    @cached_property
+    def platform_totals(self):
+        return self.df.groupby('Platform').size()
+
+    @cached_property
+    def resolved_cases(self):
+        df = self.df
+
+        # Filter cases that have a valid resolution date (not before they entered the queue)
+        resolved_cases = df[df['Resolution Date'].notna() & ~self.reversed_interval].copy()
+
+        # Calculate resolution time
+        resolved_cases['Average Resolution Time'] = resolved_cases.apply(
+            lambda row: business_timedelta(row['Entered Queue'], row['Resolution Date']), axis=1
+        )
+
+        # Recompute Hours & Days based on new business timedelta
+        resolved_cases['Resolution Hours'] = resolved_cases['Average Resolution Time'].apply(
+            lambda td: td.total_seconds() / 3600 if pd.notna(td) else None
+        )
+        resolved_cases['Resolution Days'] = resolved_cases['Average Resolution Time'].apply(
+            lambda td: td.total_seconds() / 86400 if pd.notna(td) else None
+        )
+
+        # Round resolution time columns to full seconds
+        resolved_cases['Average Resolution Time'] = resolved_cases['Average Resolution Time'].dt.round('1s')
+        return resolved_cases
+
+    @cached_property
+    def escalated_cases(self):
+        # Only escalated cases (where Escalated == "Yes")
+        return self.df[is_escalated(self.df['Escalated'])]
+
+    @cached_property
+    def escalated_resolved_cases(self):
+        return self.resolved_cases[is_escalated(self.resolved_cases['Escalated'])].copy()
+
+
+# Display tables
+def print_table(df, title, show_index=True, colalign=None):
+    from tabulate import tabulate
+
+    print(f"\n{title}")
+    print(tabulate(
+        df,
+        headers='keys',
+        showindex=show_index,
+        tablefmt='pretty',
+        stralign='left',
+        numalign='right',
+        colalign=colalign  # Custom alignment
+    ))
+
+
+def safe_sheet_name(name: str) -> str:
+    """Truncate/sanitize sheet names to be Excel-safe."""
+    name = re.sub(r'[\\/*?:\[\]]', '', name)
+    return name[:31]
+
+
+def concat_with_blank_rows(grouped_df):
+    """Combine grouped DataFrames with a blank row between groups, preserving column order."""
+    parts = []
+    # Keep column order from the first group
+    first_cols = None
+    for _, subdf in grouped_df:
+        if first_cols is None:
+            first_cols = list(subdf.columns)
+        subdf = subdf.reindex(columns=first_cols)
+        parts.append(subdf)
+        blank = pd.DataFrame([{col: "" for col in first_cols}])
+        parts.append(blank)
+    return pd.concat(parts, ignore_index=True)
+
+
+def with_total_row(table, label_col, count_col, percentage="100.0%"):
+    """Percentage of the column total per row, plus a Total row (Sections 1, 5, 7, 10, 11)."""
+    total = table[count_col].sum()
+    table["Percentage"] = (
+        table[count_col] / total * 100
+    ).round(1).astype(str) + "%"
+
+    total_row = pd.DataFrame([{
+        label_col: "Total",
+        count_col: total,
+        "Percentage": percentage
+    }])
+    return pd.concat([table, total_row], ignore_index=True)
+
+
+# ------------------------------------- SECTIONS ---------------------------------------------
+# Each section prints its tables and appends (sheet name, DataFrame) pairs to `sheets` for the export.
+
+SECTIONS = {}
+
+
+def section(key, title):
+    def register(func):
+        SECTIONS[key] = (title, func)
+        return func
+    return register
+
+
+@section("0", "Data quality checks")
+def data_quality_section(data, sheets):
+    print_table(
+        data.dq_summary,
+        "0. DATA QUALITY CHECKS",
+        show_index=False,
+        colalign=("left", "right", "right")
+    )
+    sheets.append(("0_Data_Quality", data.dq_summary))
+    sheets.append(("0_Quarantine", data.dq_quarantine))
+
+    # Subjects predicted from titles (Sections 3, 8, 17, 21 and 22 count the filled ones)
+    predicted_subjects = predicted_subjects_table(data.df)
+    filled = int(predicted_subjects['Subject Predicted'].sum())
+    print(f"\nEmpty Subjects predicted from titles: {filled} filled "
+          f"(confidence >= {MIN_CONFIDENCE}), {len(predicted_subjects) - filled} left empty")
+    sheets.append(("0_Predicted_Subjects", predicted_subjects))
+
+
+@section("1", "Case count by platform")
+def platform_section(data, sheets):
+    platform_counts_df = data.df['Platform'].value_counts(dropna=False).reset_index()
+    platform_counts_df.columns = ['Platform', 'Case Count']
+    platform_counts_df.index += 1
+    platform_summary = with_total_row(platform_counts_df, "Platform", "Case Count")
+
+    print_table(
+        platform_summary,
+        "1. CASE COUNT BY PLATFORM",
+        show_index=False,
+        colalign=("left", "right", "right")
+    )
+    sheets.append(("1_Case_Count_by_PF", platform_summary))
+
+
+@section("2", "Case count by platform (monthly)")
+def monthly_platform_section(data, sheets):
+    monthly_platform_counts = (
+        data.df.groupby(['Year-Month', 'Platform'])
+        .size()
+        .reset_index(name='Case Count')
+    )
+
+    # Add percentage relative to month total
+    monthly_totals = monthly_platform_counts.groupby('Year-Month')['Case Count'].transform('sum')
+    monthly_platform_counts['Percentage'] = (
+        monthly_platform_counts['Case Count'] / monthly_totals * 100
+    ).round(1).astype(str) + "%"
+
+    print("\n2. CASE COUNT BY PLATFORM (MONTHLY)")
+    monthly_sorted_parts = []
+    for month, table in monthly_platform_counts.groupby('Year-Month'):
+        # Sort descending by Case Count (same as Section 1)
+        table = table.sort_values("Case Count", ascending=False).reset_index(drop=True).copy()
+
+        total_cases = table['Case Count'].sum()
+        pct_sum = pd.to_numeric(table['Percentage'].str.rstrip('%')).sum()
+
+        total_row = pd.DataFrame([{
+            "Year-Month": month,
+            "Platform": "Total",
+            "Case Count": total_cases,
+            "Percentage": f"{pct_sum:.1f}%"
+        }])
+
+        table_with_total = pd.concat([table, total_row], ignore_index=True)
+
+        print_table(
+            table_with_total.drop(columns=['Year-Month']),
+            f"Case Count by Platform - {month}",
+            show_index=False,
+            colalign=("left", "right", "right")
+        )
+
+        # Export: this month’s block and a blank row
+        monthly_sorted_parts.append(table_with_total)
+        monthly_sorted_parts.append(pd.DataFrame([{col: "" for col in table_with_total.columns}]))
+
+    # Combine all months, preserving column order
+    monthly_concat = pd.concat(monthly_sorted_parts, ignore_index=True)[
+        ["Year-Month", "Platform", "Case Count", "Percentage"]
+    ]
+    sheets.append((safe_sheet_name("2_Monthly_Platform_Cases"), monthly_concat))
+
+
+@section("3", "Top 5 subjects by platform")
+def platform_subject_section(data, sheets):
+    # Subject counts
+    platform_subject_counts = (
+        data.df.groupby(['Platform', 'Subject']).size().reset_index(name='Case Count')
+    )
+
+    # % of the platform total
+    platform_subject_counts['Percentage'] = (
+        platform_subject_counts['Case Count'] /
+        platform_subject_counts['Platform'].map(data.platform_totals) * 100
+    ).round(1).astype(str) + '%'
+
+    # Top 5 per platform
+    top5_per_platform = (
+        platform_subject_counts
+        .sort_values(['Platform', 'Case Count'], ascending=[True, False])
+        .groupby('Platform')
+        .head(5)
+    )
+
+    print("\n3. TOP 5 SUBJECTS BY PLATFORM")
+    for platform, table in top5_per_platform.groupby('Platform'):
+        print_table(
+            table.reset_index(drop=True),
+            f"Top 5 Subjects - {platform}",
+            show_index=False,
+            colalign=("left", "left", "right", "right")
+        )
+    sheets.append((safe_sheet_name("3_Top5_Subjects_by_PF"), concat_with_blank_rows(top5_per_platform.groupby("Platform"))))
+
+
+@section("4", "Top 10 customers by platform")
+def platform_customer_section(data, sheets):
+    from .customer_stats import CustomerCounts, top_customers_table
+
+    # Customer counts per platform, excluding internal accounts (see config.excluded_customers)
+    customer_counts = CustomerCounts(excluded=config.excluded_customers)
+    customer_counts.add(data.df['Platform'], data.df['Customer'])
+
+    # Heap-based top 10 per platform, percentage relative to platform total
+    top10_per_platform = top_customers_table(customer_counts, 10, data.platform_totals)
+
+    print("\n4. TOP 10 CUSTOMERS BY PLATFORM")
+    for platform, table in top10_per_platform.groupby('Platform'):
+        print_table(
+            table.reset_index(drop=True),
+            f"Top 10 Customers - {platform}",
+            show_index=False,
+            colalign=("left", "left", "right", "right")
+        )
+    sheets.append((safe_sheet_name("4_Top10_Customers_by_PF"), concat_with_blank_rows(top10_per_platform.groupby("Platform"))))
+
+
+@section("4.1", "Top 10 customers by platform over rolling windows")
+def rolling_customer_section(data, sheets):
+    from .customer_stats import RollingCustomerCounts, top_customers_table
+
+    df = data.df
+    # Windows end at the latest case
+    latest_entered = df['Entered Queue'].max()
+    for days in config.customer_windows:
+        window_counts = RollingCustomerCounts(df, days, excluded=config.excluded_customers).advance(latest_entered)
+        window_cases = df[df['Entered Queue'] > latest_entered - pd.Timedelta(days=days)]
+        top10_window = top_customers_table(window_counts, 10, window_cases.groupby('Platform').size())
+
+        print(f"\n4.1. TOP 10 CUSTOMERS BY PLATFORM (LAST {days} DAYS)")
+        for platform, table in top10_window.groupby('Platform'):
+            print_table(
+                table.reset_index(drop=True),
+                f"Top 10 Customers (last {days} days) - {platform}",
+                show_index=False,
+                colalign=("left", "left", "right", "right")
+            )
+        sheets.append((safe_sheet_name(f"4.1_Top10_Customers_{days}d"), concat_with_blank_rows(top10_window.groupby("Platform"))))
+
+
+@section("5", "Case count by team member")
+def member_section(data, sheets):
+    cases_by_member_df = data.df['Worked By'].value_counts().reset_index()
+    cases_by_member_df.columns = ['Team Member', 'Case Count']
+    cases_by_member_df.index += 1
+    cases_by_member_summary = with_total_row(cases_by_member_df, "Team Member", "Case Count")
+
+    print_table(
+        cases_by_member_summary,
+        "\n5. CASE COUNT BY TEAM MEMBER",
+        show_index=False,
+        colalign=("left", "right", "right")
+    )
+    sheets.append(("5_Case_by_Member", cases_by_member_summary))
+
+
+@section("6", "Platforms worked by team member")
+def member_platform_section(data, sheets):
+    member_platform_counts = (
+        data.df.groupby(['Worked By', 'Platform'])
+          .size()
+          .reset_index(name='Case Count')
+          .sort_values(['Worked By', 'Case Count'], ascending=[True, False])
+    )
+
+    print("\n6. PLATFORMS WORKED BY TEAM MEMBER")
+    for member, table in member_platform_counts.groupby('Worked By'):
+        total_cases = table["Case Count"].sum()
+        table["Percentage"] = (table["Case Count"] / total_cases * 100).round(1).astype(str) + "%"
+
+        member_total_row = pd.DataFrame([{
+            "Worked By": member,
+            "Platform": "Total",
+            "Case Count": total_cases,
+            "Percentage": "100.0%"
+        }])
+
+        table_with_total = pd.concat([table, member_total_row], ignore_index=True)
+
+        print_table(
+            table_with_total.reset_index(drop=True).drop(columns=["Worked By"]),
+            f"Platforms - {member}",
+            show_index=False,
+            colalign=("left", "right", "right")
+        )
+    sheets.append((safe_sheet_name("6_Platform_by_Member"), concat_with_blank_rows(member_platform_counts.groupby("Worked By"))))
+
+
+@section("7", "Case count by priority")
+def priority_section(data, sheets):
+    cases_by_priority_df = data.df['Priority'].value_counts().reset_index()
+    cases_by_priority_df.columns = ['Priority', 'Case Count']
+    cases_by_priority_df.index += 1
+    cases_by_priority_summary = with_total_row(cases_by_priority_df, "Priority", "Case Count")
+
+    print_table(
+        cases_by_priority_summary,
+        "\n7. CASE COUNT BY PRIORITY",
+        show_index=False,
+        colalign=("left", "right", "right")
+    )
+    sheets.append(("7_Cases_by_Priority", cases_by_priority_summary))
+
+
+@section("8", "Top 5 subjects by priority")
+def priority_subject_section(data, sheets):
+    df = data.df
+    priority_totals = df.groupby('Priority').size()
+
+    priority_subject_counts = (
+        df.groupby(['Priority', 'Subject']).size().reset_index(name='Case Count')
+    )
+
+    priority_subject_counts['Percentage'] = (
+        priority_subject_counts['Case Count'] /
+        priority_subject_counts['Priority'].map(priority_totals) * 100
+    ).round(1).astype(str) + '%'
+
+    top5_subjects_per_priority = (
+        priority_subject_counts
+        .sort_values(['Priority', 'Case Count'], ascending=[True, False])
+        .groupby('Priority')
+        .head(5)
+    )
+
+    print("\n8. TOP 5 SUBJECTS BY PRIORITY")
+    for priority, table in top5_subjects_per_priority.groupby('Priority'):
+        print_table(
+            table.reset_index(drop=True),
+            f"Top 5 Subjects - Priority: {priority}",
+            show_index=False,
+            colalign=("left", "left", "right", "right")
+        )
+    sheets.append((safe_sheet_name("8_Top5_Subjects_by_Priority"),
+                   concat_with_blank_rows(top5_subjects_per_priority.groupby("Priority"))))
+
+
+@section("9", "Top 10 busiest days")
+def busiest_days_section(data, sheets):
+    top_days_df = data.df['Entered Queue'].dt.date.value_counts().head(10).reset_index()
+    top_days_df.columns = ['Date', 'Case Count']
+    top_days_df.index += 1
+
+    print_table(top_days_df, "\n9. TOP 10 BUSIEST DAYS OF 2025")
+    sheets.append(("9_Top10_Busiest_Days", top_days_df))
+
+
+@section("10", "Average case count by weekday")
+def weekday_section(data, sheets):
+    df = data.df
+
+    # Count cases per date and day of week
+    cases_per_day = df.groupby([df['Entered Queue'].dt.date, 'Day of Week']).size().reset_index(name='Case Count')
+
+    # Average case count by day of week, rounded to nearest whole number
+    avg_cases_by_dow = (
+        cases_per_day.groupby('Day of Week')['Case Count']
+        .mean()
+        .round(0)
+        .astype(int)  # convert to integer
+        .reindex(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+        .reset_index()
+    )
+    avg_cases_summary = with_total_row(avg_cases_by_dow, "Day of Week", "Case Count")
+
+    print_table(
+        avg_cases_summary,
+        "\n10. AVERAGE CASE COUNT BY WEEKDAY",
+        show_index=False,
+        colalign=("left", "right", "right")
+    )
+    sheets.append(("10_Avg_Cases_by_Weekday", avg_cases_summary))
+
+
+@section("11", "Cases entered queue by hour")
+def hourly_section(data, sheets):
+    peak_hours_df = data.df['Entered Queue'].dt.hour.value_counts().sort_index().reset_index()
+    peak_hours_df.columns = ['Hour', 'Cases Entered']
+    hourly_summary = with_total_row(peak_hours_df, "Hour", "Cases Entered")
+
+    print_table(
+        hourly_summary,
+        "\n11. CASE ENTERED QUEUE BY HOUR (EST)",
+        show_index=False,
+        colalign=("left", "right", "right")
+    )
+    sheets.append(("11_Cases_by_Hour", hourly_summary))
+
+
+@section("12", "Average resolution time by priority")
+def resolution_priority_section(data, sheets):
+    resolved_cases = data.resolved_cases
+
+    # 12.1. Average resolved time for all cases
+    avg_resolved_time = resolved_cases['Average Resolution Time'].mean()
+
+    # 12.2. Average resolved time of Normal priority cases
+    avg_normal_priority = resolved_cases[resolved_cases['Priority'].isna() | (resolved_cases['Priority'] == 'Normal')]['Average Resolution Time'].mean()
+
+    # 12.3. Average resolved time of High priority cases
+    avg_high_priority = resolved_cases[resolved_cases['Priority'] == 'High']['Average Resolution Time'].mean()
+
+    print("\n12. AVERAGE RESOLUTION TIME BY PRIORITY")
+    print("Overall average (all cases):", format_timedelta(avg_resolved_time))
+    print("Normal priority cases:", format_timedelta(avg_normal_priority))
+    print("High priority cases:", format_timedelta(avg_high_priority))
+
+    avg_res_summary = pd.DataFrame({
+        "Priority": [
+            "Overall average (all cases)",
+            "Normal priority cases",
+            "High priority cases"
+        ],
+        "Average Resolution Time": [
+            format_timedelta(avg_resolved_time),
+            format_timedelta(avg_normal_priority),
+            format_timedelta(avg_high_priority)
+        ]
+    })
+    sheets.append(("12_Avg_Resolution_Time", avg_res_summary))
+
+
+@section("13", "Average resolution time by platform")
+def resolution_platform_section(data, sheets):
+    avg_by_platform = data.resolved_cases.groupby('Platform')['Average Resolution Time'].mean().reset_index()
+    avg_by_platform_with_days = avg_by_platform.sort_values(by='Average Resolution Time').copy()
+
+    # Add days column (1 decimal)
+    avg_by_platform_with_days["Resolution Days"] = (
+        avg_by_platform_with_days["Average Resolution Time"].dt.total_seconds() / 86400
+    ).round(1)
+
+    # Format the timedelta column into readable hh:mm:ss
+    avg_by_platform_with_days["Average Resolution Time"] = (
+        avg_by_platform_with_days["Average Resolution Time"].apply(format_timedelta)
+    )
+
+    print_table(
+        avg_by_platform_with_days,
+        "\n13. AVERAGE RESOLUTION TIME BY PLATFORM",
+        show_index=False,
+        colalign=("left", "right", "right")
+    )
+    sheets.append(("13_Avg_Res_Time_by_PF", avg_by_platform_with_days))
+
+
+@section("14", "Average resolution time by team member")
+def resolution_member_section(data, sheets):
+    avg_by_member = data.resolved_cases.groupby('Worked By')['Average Resolution Time'].mean().reset_index()
+    avg_by_member_sorted = avg_by_member.sort_values(by='Average Resolution Time')
+
+    print_table(avg_by_member_sorted.assign(
+        **{'Average Resolution Time': avg_by_member_sorted['Average Resolution Time'].apply(format_timedelta)}),
+        "\n14. AVERAGE RESOLUTION TIME BY TEAM MEMBER", show_index=False, colalign=("left", "right"))
+
+    # Export formatted, with days
+    avg_by_member_export = avg_by_member_sorted.copy()
+    avg_by_member_export["Average Resolution"] = avg_by_member_export["Average Resolution Time"].apply(format_timedelta)
+    avg_by_member_export["Resolution Days"] = (
+        avg_by_member_export["Average Resolution Time"].dt.total_seconds() / 86400
+    ).round(1)
+    avg_by_member_export = avg_by_member_export.drop(columns=["Average Resolution Time"])
+    sheets.append(("14_Avg_Res_Time_by_Member", avg_by_member_export))
+
+
+@section("15", "Case count by resolution time range")
+def resolution_range_section(data, sheets):
+    resolved_cases = data.resolved_cases
+
+    under_12_hours = resolved_cases[resolved_cases['Resolution Hours'] <= 12].shape[0]
+    between_12_24_hours = resolved_cases[(resolved_cases['Resolution Hours'] > 12) & (resolved_cases['Resolution Hours'] <= 24)].shape[0]
+    between_1_3_days = resolved_cases[(resolved_cases['Resolution Days'] > 1) & (resolved_cases['Resolution Days'] <= 3)].shape[0]
+    between_3_7_days = resolved_cases[(resolved_cases['Resolution Days'] > 3) & (resolved_cases['Resolution Days'] <= 7)].shape[0]
+    over_7_days = resolved_cases[resolved_cases['Resolution Days'] > 7].shape[0]
+
+    resolution_ranges = pd.DataFrame([
+        {"Resolution time": "Under 12 hours", "Case Count": under_12_hours},
+        {"Resolution time": "12 - 24 hours", "Case Count": between_12_24_hours},
+        {"Resolution time": "1 - 3 days", "Case Count": between_1_3_days},
+        {"Resolution time": "3 - 7 days", "Case Count": between_3_7_days},
+        {"Resolution time": "Over 7 days", "Case Count": over_7_days},
+    ])
+    resolution_summary = with_total_row(resolution_ranges, "Resolution time", "Case Count", percentage="100%")
+
+    print_table(
+        resolution_summary,
+        "\n15. CASE COUNT BY RESOLUTION TIME RANGE",
+        show_index=False,
+        colalign=("left", "right", "right")
+    )
+    sheets.append(("15_Res_Time_Range", resolution_summary))
+
+
+@section("16", "Escalated case count by subject")
+def escalated_subject_section(data, sheets):
+    escalated_cases = data.escalated_cases
+
+    # Escalated cases with a non-empty subject (entered by the team, not predicted)
+    escalated_with_subject = escalated_cases[
+        escalated_cases['Subject'].notna() & (escalated_cases['Subject'].astype(str).str.strip() != "")
+        & ~escalated_cases['Subject Predicted']
+    ]
+    escalated_predicted_subject_count = int(escalated_cases['Subject Predicted'].sum())
+
+    # Average resolved time for escalated cases, rounded up to seconds
+    escalated_resolved_cases = data.escalated_resolved_cases
+    if not escalated_resolved_cases.empty:
+        avg_escalated_time = escalated_resolved_cases['Average Resolution Time'].mean()
+        avg_escalated_time = timedelta(seconds=math.ceil(avg_escalated_time.total_seconds()))
+    else:
+        avg_escalated_time = None
+
+    # Count number of escalated cases per Subject
+    subject_escalated_counts = escalated_cases['Subject'].value_counts().reset_index()
+    subject_escalated_counts.columns = ['Subject', 'Escalated Case Count']
+    subject_escalated_summary = with_total_row(subject_escalated_counts, "Subject", "Escalated Case Count")
+
+    print(f"\nESCALATED CASES:")
+    print(f"Total escalated cases: {escalated_cases.shape[0]}")
+    print(f"Escalated cases with a Subject: {escalated_with_subject.shape[0]}")
+    print(f"Escalated cases with a predicted Subject: {escalated_predicted_subject_count}")
+
+    if avg_escalated_time is not None:
+        print("Average resolved time of Escalated cases:", avg_escalated_time)
+
+    print_table(subject_escalated_summary, "\n16. ESCALATED CASE COUNT BY SUBJECT", show_index=False)
+    sheets.append(("16_Escalated_Subjects", subject_escalated_summary))
+
+
+@section("17", "Escalated subjects by platform")
+def escalated_platform_section(data, sheets):
+    escalated_subject_platform_counts = (
+        data.escalated_cases
+        .groupby(['Platform', 'Subject'])
+        .size()
+        .reset_index(name='Escalated Case Count')
+        .sort_values(['Platform', 'Escalated Case Count'], ascending=[True, False])
+    )
+
+    print("\n17. ESCALATED SUBJECTS BY PLATFORM")
+    for platform, table in escalated_subject_platform_counts.groupby('Platform'):
+        total_platform = table["Escalated Case Count"].sum()
+        table["Percentage"] = (table["Escalated Case Count"] / total_platform * 100).round(1).astype(str) + "%"
+
+        platform_total_row = pd.DataFrame([{
+            "Platform": platform,
+            "Subject": "Total",
+            "Escalated Case Count": total_platform,
+            "Percentage": "100.0%"
+        }])
+
+        table_with_total = pd.concat([table, platform_total_row], ignore_index=True)
+
+        print_table(
+            table_with_total.reset_index(drop=True),
+            f"Escalated Subjects - {platform}",
+            show_index=False
+        )
+    sheets.append((safe_sheet_name("17_Escalated_Subjects_by_PF"),
+                   concat_with_blank_rows(escalated_subject_platform_counts.groupby("Platform"))))
+
+
+@section("18", "Average resolution time for escalated cases by platform")
+def escalated_resolution_section(data, sheets):
+    escalated_resolved_cases = data.escalated_resolved_cases
+    if escalated_resolved_cases.empty:
+        return
+
+    escalated_avg_by_platform = (
+        escalated_resolved_cases
+        .groupby('Platform')['Average Resolution Time']
+        .mean()
+        .reset_index()
+    )
+
+    # Format as d hh:mm:ss
+    escalated_avg_by_platform["Avg Resolution"] = (
+        escalated_avg_by_platform["Average Resolution Time"].apply(format_timedelta)
+    )
+
+    # Days (rounded 1 decimal)
+    escalated_avg_by_platform["Avg Resolution Days"] = (
+        escalated_avg_by_platform["Average Resolution Time"].dt.total_seconds() / 86400
+    ).round(1)
+
+    # Sort from shortest to longest
+    escalated_avg_by_platform = escalated_avg_by_platform.sort_values("Average Resolution Time")
+
+    # Drop raw timedelta (keep formatted)
+    escalated_avg_by_platform = escalated_avg_by_platform.drop(columns=["Average Resolution Time"])
+
+    # Reorder columns: hh:mm:ss before days
+    escalated_avg_by_platform = escalated_avg_by_platform[
+        ["Platform", "Avg Resolution", "Avg Resolution Days"]
+    ].reset_index(drop=True)
+
+    # Make rank start from 1 instead of 0
+    escalated_avg_by_platform.index += 1
+
+    print_table(
+        escalated_avg_by_platform,
+        "\n18. AVERAGE RESOLUTION TIME FOR ESCALATED CASES BY PLATFORM",
+        show_index=True,
+        colalign=("left", "left", "right")
+    )
+    sheets.append(("18_Escalated_Avg_Res_Time", escalated_avg_by_platform))
+
+
+def build_cases_overlap(df_period, escalated_value):
+    """Case count per (overlapping) platform group, as a share of all cases in df_period."""
+    escalated = is_escalated(df_period['Escalated'])
+    filtered = df_period[escalated if escalated_value else ~escalated]
+    total_cases = df_period.shape[0]
+
+    results = []
+    for group_name, platforms in config.group_definitions.items():
+        count = filtered[filtered['Platform'].astype(str).str.upper().isin(platforms)].shape[0]
+        results.append({"Platform Group": group_name, "Case Count": count})
+
+    # Compute percentage of total
+    summary = pd.DataFrame(results)
+    summary["% of Total"] = (summary["Case Count"] / total_cases * 100).round(1).astype(str) + "%"
+
+    # Add total row
+    total_row = pd.DataFrame([{
+        "Platform Group": "Total",
+        "Case Count": summary["Case Count"].sum(),
+        "% of Total": f"{(summary['Case Count'].sum() / total_cases * 100):.1f}%"
+    }])
+    return pd.concat([summary, total_row], ignore_index=True)
+
+
+# 6-month period data (special request)
+@section("19", "Case count by platform group (Apr 1 - Sep 30, 2025)")
+def platform_group_section(data, sheets):
+    df = data.df
+    start_date = pd.Timestamp(config.special_period_start)
+    end_date = pd.Timestamp(config.special_period_end)
+
+    # Filter by date range
+    df_apr_sep = df[(df['Entered Queue'] >= start_date) & (df['Entered Queue'] <= end_date)].copy()
+
+    non_escalated_19 = build_cases_overlap(df_apr_sep, escalated_value=False)
+    escalated_19 = build_cases_overlap(df_apr_sep, escalated_value=True)
+
+    print(f"\nTotal cases from April 1 to September 30, 2025: {df_apr_sep.shape[0]}")
+    print_table(non_escalated_19, "\n19. NON-ESCALATED CASES (Apr 1 - Sep 30, 2025)",
+                show_index=False, colalign=("left", "right", "right"))
+    print_table(escalated_19, "\n19. ESCALATED CASES (Apr 1 - Sep 30, 2025)",
+                show_index=False, colalign=("left", "right", "right"))
+
+    sheets.append((safe_sheet_name("19.1_L2_Cases_Apr-Sep2025"), non_escalated_19))
+    sheets.append((safe_sheet_name("19.2_L3_Cases_Apr-Sep2025"), escalated_19))
+
+
+@section("20", "Top 20 open cases by escalation risk")
+def escalation_risk_section(data, sheets):
+    from .escalation_risk import score_open_cases
+
+    # Escalation risk and expected remaining time (given how long each case is already open)
+    open_case_risk = score_open_cases(data.df, data.resolved_cases['Resolution Hours'])
+
+    open_case_risk_display = open_case_risk.assign(**{
+        'Entered Queue': open_case_risk['Entered Queue'].dt.strftime('%Y-%m-%d %H:%M'),
+        'Escalation Risk': (open_case_risk['Escalation Risk'] * 100).round(1).astype(str) + '%',
+        'Open Days': (open_case_risk['Elapsed Hours'] / 24).round(1),
+        'Expected Remaining Days': (open_case_risk['Expected Remaining Hours'] / 24).round(1),
+    }).drop(columns=['Elapsed Hours', 'Expected Resolution Hours', 'Expected Remaining Hours']).reset_index(drop=True)
+    open_case_risk_display.index += 1
+
+    print(f"\nOpen cases scored: {len(open_case_risk_display)}")
+    print_table(
+        open_case_risk_display.head(20),
+        "\n20. TOP 20 OPEN CASES BY ESCALATION RISK",
+        show_index=True
+    )
+    sheets.append(("20_Open_Case_Escalation_Risk", open_case_risk_display))
+
+
+@section("21", "Period comparison against the cached baseline")
+def period_comparison_section(data, sheets):
+    from .period_compare import compare_periods, to_period
+
+    # Current period defaults to the latest month, baseline to the period before it (cached in baselines/)
+    if config.compare_period:
+        current_period = to_period(config.compare_period)
+    else:
+        current_period = data.df['Entered Queue'].max().to_period('M')
+    if config.compare_baseline:
+        baseline_period = to_period(config.compare_baseline)
+    else:
+        baseline_period = current_period - 1
+    period_deltas = compare_periods(data.df, current_period, baseline_period, data.resolved_cases['Resolution Hours'])
+
+    # Compact columns on screen; full tables are exported
+    print(f"\n21. PERIOD COMPARISON: {current_period} vs {baseline_period}")
+    for name, delta in period_deltas.items():
+        print_table(
+            delta[[name, 'Case Count (Baseline)', 'Case Count (Current)', 'Case Count Change',
+                   'Case Count Change %', 'Escalation Rate Change (pp)', 'Resolution P50 Hours Change']],
+            f"Change by {name} ({current_period} vs {baseline_period})",
+            show_index=False
+        )
+        sheets.append((safe_sheet_name(f"21_Delta_by_{name.replace(' ', '_')}"), delta))
+
+
+@section("22", "Pivot cube for BI tools")
+def pivot_cube_section(data, sheets):
+    from .cube import build_cube, save_cube, rollup, cube_path, DIMENSIONS
+
+    # Every non-empty Platform x Subject x Priority x Worked By x Year-Month x Escalated cell,
+    # saved so any roll-up (--rollup) is answered from the cells instead of the rows
+    cube = build_cube(data.df, data.resolved_cases['Resolution Hours'])
+    save_cube(cube, cube_path)
+
+    print(f"\n22. PIVOT CUBE: {len(cube)} non-empty cells over {', '.join(DIMENSIONS)} saved to {cube_path}")
+    print_table(
+        rollup(cube, ['Priority', 'Escalated']),
+        "Example roll-up: Priority x Escalated",
+        show_index=False
+    )
+
+
+# ------------------------------------- EXPORT RESULTS TO EXCEL ---------------------------------------------
+
+def export_sheets(sheets, output_path=config.output_path):
+    """
+    Write all sheets to output_path through a unique temp workbook renamed into place
+    (core.atomic_output), so readers never open a half-written workbook.
+    """
+    with atomic_output(output_path) as tmp_output_path:
+        with pd.ExcelWriter(tmp_output_path, engine="openpyxl") as writer:
+            for sheet_name, table in sheets:
+                table.to_excel(writer, sheet_name=sheet_name, index=False)
+
+
+def run(sections=None, export=True, output_path=config.output_path, file_path=config.file_path):
+    """Build the report: every section (or only the selected keys), optionally exported to Excel."""
+    keys = list(SECTIONS) if not sections else sections
+    data = ReportData(file_path=file_path)
+
+    sheets = []
+    for key in keys:
+        _, build = SECTIONS[key]
+        build(data, sheets)
+
+    if export:
+        export_sheets(sheets, output_path)
+        print(f"\n✅ All tables exported successfully to {output_path}")
+    return sheets
@@ -0,0 +1,255 @@
+import os
+import re
+import zlib
+import zipfile
+import numpy as np
+
+
+model_path = "subject_model.npz"
+
+# Hashed n-gram space, rows per batch and the confidence needed to fill a Subject
+N_FEATURES = 2 ** 20
+BATCH_SIZE = 2048
+MIN_CONFIDENCE = 0.7
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+]+")
+
+_token_hash_cache = {}
+
+
+def _hash_token(token):
+    # crc32 is stable across runs (built-in hash() is salted per process)
+    index = _token_hash_cache.get(token)
+    if index is None:
+        index = zlib.crc32(token.encode("utf-8")) % N_FEATURES
+        _token_hash_cache[token] = index
+    return index
+
+
+def title_ngrams(title):
+    """Unigrams + bigrams of an already normalized title."""
+    words = TOKEN_PATTERN.findall(title)
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def hash_titles(titles):
+    """
+    Hash a batch of normalized titles into CSR arrays (indptr, indices, counts).
+    Column indices are sorted and unique within each row.
+    """
+    indptr = np.zeros(len(titles) + 1, dtype=np.int64)
+    row_indices = []
+    row_counts = []
+    for i, title in enumerate(titles):
+        hashed = np.fromiter((_hash_token(tok) for tok in title_ngrams(title)), dtype=np.int64)
+        cols, counts = np.unique(hashed, return_counts=True)
+        row_indices.append(cols)
+        row_counts.append(counts)
+        indptr[i + 1] = indptr[i] + len(cols)
+
+    if indptr[-1] == 0:
+        return indptr, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    return indptr, np.concatenate(row_indices), np.concatenate(row_counts).astype(np.float64)
+
+
+def _row_ids(indptr):
+    return np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+
+def _tfidf(indptr, indices, counts, idf):
+    """Sublinear tf * idf, L2-normalized per row (same CSR layout)."""
+    data = (1 + np.log(counts)) * idf
+    row_norms = np.sqrt(np.bincount(_row_ids(indptr), weights=data ** 2, minlength=len(indptr) - 1))
+    row_norms[row_norms == 0] = 1
+    return data / np.repeat(row_norms, np.diff(indptr))
+
+
+class SubjectClassifier:
+    """
+    Multinomial Naive Bayes over TF-IDF weighted, hashed title n-grams.
+    Only the hashed columns seen during training are kept, so the fitted
+    weights stay small enough to persist and reload on every run.
+    """
+
+    def __init__(self, alpha=0.1):
+        self.alpha = alpha
+        self.classes_ = None
+        self.feature_ids_ = None
+        self.idf_ = None
+        self.feature_log_prob_ = None
+        self.class_log_prior_ = None
+        self.training_signature_ = ""
+
+    def _vectorize(self, titles):
+        # Map hashed columns onto the compact training vocabulary, dropping unseen ones
+        indptr, indices, counts = hash_titles(titles)
+        pos = np.searchsorted(self.feature_ids_, indices)
+        pos[pos == len(self.feature_ids_)] = 0
+        known = self.feature_ids_[pos] == indices
+
+        row_ids = _row_ids(indptr)[known]
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(row_ids, minlength=len(titles)))])
+        indices = pos[known]
+        data = _tfidf(indptr, indices, counts[known], self.idf_[indices])
+        return indptr, indices, data
+
+    def fit(self, titles, subjects, batch_size=BATCH_SIZE):
+        titles = list(titles)
+        self.classes_, y = np.unique(np.asarray(subjects, dtype=str), return_inverse=True)
+
+        # Pass 1: document frequency per hashed column, batch by batch
+        batches = []
+        doc_freq = {}
+        for start in range(0, len(titles), batch_size):
+            indptr, indices, counts = hash_titles(titles[start:start + batch_size])
+            batches.append((start, indptr, indices, counts))
+            cols, freq = np.unique(indices, return_counts=True)
+            for col, f in zip(cols.tolist(), freq.tolist()):
+                doc_freq[col] = doc_freq.get(col, 0) + f
+
+        self.feature_ids_ = np.array(sorted(doc_freq), dtype=np.int64)
+        df_counts = np.array([doc_freq[c] for c in self.feature_ids_.tolist()], dtype=np.float64)
+        self.idf_ = np.log((1 + len(titles)) / (1 + df_counts)) + 1
+
+        # Pass 2: accumulate tf-idf mass per (class, feature)
+        class_feature = np.zeros((len(self.classes_), len(self.feature_ids_)))
+        for start, indptr, indices, counts in batches:
+            cols = np.searchsorted(self.feature_ids_, indices)
+            data = _tfidf(indptr, cols, counts, self.idf_[cols])
+            rows = y[start + _row_ids(indptr)]
+            np.add.at(class_feature, (rows, cols), data)
+
+        smoothed = class_feature + self.alpha
+        self.feature_log_prob_ = np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))
+        self.class_log_prior_ = np.log(np.bincount(y, minlength=len(self.classes_)) / len(y))
+        return self
+
+    def predict(self, titles, batch_size=BATCH_SIZE):
+        """Return (predicted subject, confidence) arrays for a list of normalized titles."""
+        titles = list(titles)
+        predictions = np.empty(len(titles), dtype=object)
+        confidence = np.zeros(len(titles))
+        weights = self.feature_log_prob_.T  # (features, classes)
+
+        for start in range(0, len(titles), batch_size):
+            batch = titles[start:start + batch_size]
+            indptr, indices, data = self._vectorize(batch)
+
+            # Sparse x dense: sum each row's weighted feature columns with reduceat
+            scores = np.tile(self.class_log_prior_, (len(batch), 1))
+            nonempty = np.diff(indptr) > 0
+            if nonempty.any():
+                contrib = weights[indices] * data[:, None]
+                scores[nonempty] += np.add.reduceat(contrib, indptr[:-1][nonempty], axis=0)
+
+            # Softmax -> probability of the winning class
+            scores -= scores.max(axis=1, keepdims=True)
+            probs = np.exp(scores)
+            probs /= probs.sum(axis=1, keepdims=True)
+            best = probs.argmax(axis=1)
+
+            predictions[start:start + len(batch)] = self.classes_[best]
+            confidence[start:start + len(batch)] = probs[np.arange(len(batch)), best]
+            # Titles with no known n-grams only carry the prior, don't trust them
+            confidence[start:start + len(batch)][~nonempty] = 0.0
+
+        return predictions, confidence
+
+    def save(self, path=model_path, training_signature=""):
+        np.savez_compressed(
+            path,
+            n_features=N_FEATURES,
+            training_signature=training_signature,
+            alpha=self.alpha,
+            classes=self.classes_,
+            feature_ids=self.feature_ids_,
+            idf=self.idf_,
+            feature_log_prob=self.feature_log_prob_,
+            class_log_prior=self.class_log_prior_,
+        )
+
+    @classmethod
+    def load(cls, path=model_path):
+        with np.load(path, allow_pickle=False) as saved:
+            if int(saved["n_features"]) != N_FEATURES:
+                raise ValueError(f"{path} was hashed with a different feature space, retrain it")
+            model = cls(alpha=float(saved["alpha"]))
+            model.classes_ = saved["classes"]
+            model.feature_ids_ = saved["feature_ids"]
+            model.idf_ = saved["idf"]
+            model.feature_log_prob_ = saved["feature_log_prob"]
+            model.class_log_prior_ = saved["class_log_prior"]
+            model.training_signature_ = str(saved["training_signature"])
+        return model
+
+
+def has_subject(subjects):
+    return subjects.notna() & (subjects.astype(str).str.strip() != "")
+
+
+def training_signature(titles, subjects):
+    """Row count + crc32 of the labelled (title, subject) pairs; changes whenever the training data does."""
+    checksum = 0
+    for title, subject in zip(titles, subjects):
+        checksum = zlib.crc32(f"{title}\t{subject}\n".encode("utf-8"), checksum)
+    return f"{len(titles)}:{checksum:08x}"
+
+
+def load_or_train(df, path=model_path, retrain=False):
+    """
+    Load the persisted model, or fit it on the labelled rows of df and save it.
+    The saved model is reused only while the labelled rows it was trained on are unchanged.
+    """
+    labelled = df[has_subject(df['Subject']) & (df['Normalized Title'] != "")]
+    titles = labelled['Normalized Title'].tolist()
+    subjects = labelled['Subject'].astype(str).str.strip().tolist()
+    signature = training_signature(titles, subjects)
+
+    if not retrain and os.path.exists(path):
+        try:
+            model = SubjectClassifier.load(path)
+            if model.training_signature_ == signature:
+                return model
+        except (ValueError, KeyError, OSError, zipfile.BadZipFile):
+            pass
+
+    model = SubjectClassifier().fit(titles, subjects)
+    model.training_signature_ = signature
+    model.save(path, training_signature=signature)
+    return model
+
+
+def fill_missing_subjects(df, path=model_path, retrain=False, min_confidence=MIN_CONFIDENCE):
+    """
+    Predict Subject from Normalized Title where Subject is empty.
+    Adds 'Suggested Subject' and 'Subject Confidence' (both empty for labelled rows) and
+    'Subject Predicted'; only predictions at or above min_confidence are written into 'Subject'.
+    """
+    df['Suggested Subject'] = np.nan
+    df['Subject Confidence'] = np.nan
+    df['Subject Predicted'] = False
+
+    missing = ~has_subject(df['Subject']) & (df['Normalized Title'] != "")
+    if not missing.any():
+        return df
+
+    model = load_or_train(df, path=path, retrain=retrain)
+    predicted, confidence = model.predict(df.loc[missing, 'Normalized Title'])
+
+    df['Suggested Subject'] = df['Suggested Subject'].astype(object)
+    df.loc[missing, 'Suggested Subject'] = predicted
+    df.loc[missing, 'Subject Confidence'] = confidence.round(3)
+    accepted = missing.copy()
+    accepted[missing] = confidence >= min_confidence
+    df.loc[accepted, 'Subject'] = predicted[confidence >= min_confidence]
+    df.loc[accepted, 'Subject Predicted'] = True
+    return df
+
+
+PREDICTION_COLUMNS = ['Case Number', 'Title', 'Suggested Subject', 'Subject Confidence', 'Subject Predicted']
+
+
+def predicted_subjects_table(df):
+    """Every row the model scored, most confident first, for analysts to review."""
+    scored = df[df['Subject Confidence'].notna()]
+    return scored[PREDICTION_COLUMNS].sort_values('Subject Confidence', ascending=False).reset_index(drop=True)
@@ -0,0 +1,125 @@
+import os
+import sys
+import time
+import subprocess
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from . import config
+
+
+# Parent of the package, so `python -m mhs_support` resolves from any working directory
+package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POLL_INTERVAL = 2.0   # seconds between mtime/size checks
+DEBOUNCE = 5.0        # file must be unchanged this long before a rerun
+
+
+def log(message):
+    print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}", flush=True)
+
+
+def file_signature(path):
+    """(size, mtime_ns) of the file, or None while it is missing (e.g. mid-replace)."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def subprocess_env():
+    """Environment for `python -m mhs_support` children, with the package importable from any cwd."""
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")])))
+
+
+def run_report(path=config.file_path):
+    """
+    Regenerate the report in a separate process.
+    The report reloads through the case store (only re-parsed when the workbook changed)
+    and writes analysis_output.xlsx via a temp file + rename.
+    """
+    log("Workbook changed, regenerating report...")
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", "mhs_support", "--file", path],
+        env=subprocess_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode == 0:
+        log(f"Report regenerated in {elapsed:.1f}s")
+    else:
+        log(f"Report failed (exit {result.returncode}):\n{result.stderr.strip()}")
+
+
+class ReportRunner:
+    """Runs reports on a single worker thread; changes during a run queue exactly one rerun."""
+
+    def __init__(self, path=config.file_path):
+        self.path = path
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._lock = threading.Lock()
+        self._running = False
+        self._rerun = False
+
+    def request(self):
+        with self._lock:
+            if self._running:
+                self._rerun = True
+                return
+            self._running = True
+        self._executor.submit(self._work)
+
+    def _work(self):
+        while True:
+            try:
+                run_report(self.path)
+            except Exception as e:
+                log(f"Report failed: {e}")
+            with self._lock:
+                if not self._rerun:
+                    self._running = False
+                    return
+                self._rerun = False
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+
+def watch(path=config.file_path, interval=POLL_INTERVAL, debounce=DEBOUNCE, run_now=False):
+    runner = ReportRunner(path)
+    if run_now:
+        runner.request()
+
+    last_reported = file_signature(path)
+    pending = None        # signature waiting to settle
+    pending_since = 0.0
+    log(f"Watching '{path}' (poll {interval}s, debounce {debounce}s). Ctrl+C to stop.")
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = file_signature(path)
+
+            if current is None or current == last_reported:
+                pending = None
+                continue
+
+            # Restart the debounce window whenever the file is still changing
+            now = time.monotonic()
+            if current != pending:
+                pending, pending_since = current, now
+                continue
+
+            if now - pending_since >= debounce:
+                last_reported, pending = current, None
+                runner.request()
+    except KeyboardInterrupt:
+        log("Stopping watcher, waiting for the running report to finish...")
+    finally:
+        runner.shutdown()
+